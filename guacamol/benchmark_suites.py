@@ -1,3 +1,4 @@
+import functools
 from typing import Literal
 
 from guacamol.distribution_learning_benchmark import (
@@ -41,12 +42,13 @@ from guacamol.standard_benchmarks import (
 def goal_directed_benchmark_suite(
     version_name: Literal["v1", "v2", "trivial"],
 ) -> list[GoalDirectedBenchmark]:
+    # The suites are cached and shared between calls, return a fresh list for each caller
     if version_name == "v1":
-        return goal_directed_suite_v1()
+        return list(goal_directed_suite_v1())
     if version_name == "v2":
-        return goal_directed_suite_v2()
+        return list(goal_directed_suite_v2())
     if version_name == "trivial":
-        return goal_directed_suite_trivial()
+        return list(goal_directed_suite_trivial())
 
     raise Exception(f'Goal-directed benchmark suite "{version_name}" does not exist.')
 
@@ -77,9 +79,15 @@ def distribution_learning_benchmark_suite(
     raise Exception(f'Distribution-learning benchmark suite "{version_name}" does not exist.')
 
 
-def goal_directed_suite_v1() -> list[GoalDirectedBenchmark]:
+@functools.lru_cache(maxsize=None)
+def goal_directed_suite_v1() -> tuple[GoalDirectedBenchmark, ...]:
+    """
+    Goal-directed benchmarks, version 1.
+
+    The result is cached: every call returns the same tuple of shared benchmark instances.
+    """
     max_logP = 6.35584
-    return [
+    return (
         isomers_c11h24(mean_function="arithmetic"),
         isomers_c7h8n2o2(mean_function="arithmetic"),
         isomers_c9h10n2o2pf2cl(mean_function="arithmetic", n_samples=100),
@@ -138,11 +146,17 @@ def goal_directed_suite_v1() -> list[GoalDirectedBenchmark]:
         cns_mpo(max_logP=max_logP),
         qed_benchmark(),
         median_camphor_menthol(ArithmeticMeanScoringFunction),
-    ]
+    )
 
 
-def goal_directed_suite_v2() -> list[GoalDirectedBenchmark]:
-    return [
+@functools.lru_cache(maxsize=None)
+def goal_directed_suite_v2() -> tuple[GoalDirectedBenchmark, ...]:
+    """
+    Goal-directed benchmarks, version 2.
+
+    The result is cached: every call returns the same tuple of shared benchmark instances.
+    """
+    return (
         # explicit rediscovery
         similarity(
             smiles="CC1=CC=C(C=C1)C1=CC(=NN1C1=CC=C(C=C1)S(N)(=O)=O)C(F)(F)F",
@@ -201,14 +215,17 @@ def goal_directed_suite_v2() -> list[GoalDirectedBenchmark]:
         valsartan_smarts(),
         decoration_hop(),
         scaffold_hop(),
-    ]
+    )
 
 
-def goal_directed_suite_trivial() -> list[GoalDirectedBenchmark]:
+@functools.lru_cache(maxsize=None)
+def goal_directed_suite_trivial() -> tuple[GoalDirectedBenchmark, ...]:
     """
     Trivial goal-directed benchmarks from the paper.
+
+    The result is cached: every call returns the same tuple of shared benchmark instances.
     """
-    return [
+    return (
         logP_benchmark(target=-1.0),
         logP_benchmark(target=8.0),
         tpsa_benchmark(target=150.0),
@@ -216,7 +233,7 @@ def goal_directed_suite_trivial() -> list[GoalDirectedBenchmark]:
         qed_benchmark(),
         isomers_c7h8n2o2(),
         pioglitazone_mpo(),
-    ]
+    )
 
 
 def distribution_learning_suite_v1(
@@ -6,7 +6,9 @@ import hashlib
 import logging
 import os.path
 import pkgutil
+import re
 from argparse import ArgumentParser
+from itertools import chain
 from typing import TYPE_CHECKING, ContextManager, TextIO
 
 import numpy as np
@@ -14,16 +16,16 @@ from joblib import Parallel, delayed
 
 from guacamol.utils.chemistry import (
     canonicalize_list,
-    filter_and_canonicalize,
+    filter_and_canonicalize_batch,
     get_fingerprints_from_smileslist,
     initialise_neutralisation_reactions,
     split_charged_mol,
 )
-from guacamol.utils.data import download_if_not_present
+from guacamol.utils.data import download_if_not_present, remove_duplicates
 from guacamol.utils.helpers import setup_default_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable
+    from collections.abc import Callable, Collection, Sequence
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
@@ -38,6 +40,16 @@ CHEMBL_FILE_NAME = "chembl_24_1_chemreps.txt.gz"
 # Threshold to remove molecules too similar to the holdout set
 TANIMOTO_CUTOFF = 0.323
 
+# Approximate size of the block of lines read from the input file at once
+# (characters for files opened in text mode, bytes for binary files)
+READ_BLOCK_SIZE = 4 * 2**20
+# Number of bytes hashed at once when checking the output files
+HASH_CHUNK_SIZE = 2**20
+# Number of SMILES processed by a single parallel job
+FILTER_CHUNK_SIZE = 2000
+# Number of SMILES written to the output files at once
+WRITE_CHUNK_SIZE = 10000
+
 
 def get_argparser() -> ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -118,6 +130,11 @@ class AllowedSmilesCharDictionary:
                 "y",
             }
         self.forbidden_symbols = set(forbidden_symbols)
+        # Single compiled alternation so every SMILES is scanned once instead of once per symbol.
+        # Longer symbols come first, so that e.g. "Xe" is reported rather than "e".
+        self._forbidden_pattern = re.compile(
+            "|".join(map(re.escape, sorted(self.forbidden_symbols, key=len, reverse=True))),
+        )
 
     def allowed(self, smiles: str) -> bool:
         """
@@ -129,10 +146,13 @@ class AllowedSmilesCharDictionary:
         Returns:
             True if all legal
         """
-        for symbol in self.forbidden_symbols:
-            if symbol in smiles:
-                print("Forbidden symbol {:<2}  in  {}".format(symbol, smiles))
-                return False
+        if not self.forbidden_symbols:
+            return True
+
+        match = self._forbidden_pattern.search(smiles)
+        if match is not None:
+            print("Forbidden symbol {:<2}  in  {}".format(match.group(0), smiles))
+            return False
         return True
 
 
@@ -151,46 +171,40 @@ def get_raw_smiles(
     Returns:
        a list of SMILES strings
     """
-    data = []
+    data: list[str] = []
+    allowed = smiles_char_dict.allowed
     # open the gzipped chembl filegzip.open
     with open_fn(file_name, "rt") as f:
         line_count = 0
-        for line in f:
-            line_count += 1
-            # extract the canonical smiles column
-            if isinstance(line, bytes):
-                line = line.decode("utf-8")
-
-            # smiles = line.split('\t')[1] # noqa: ERA001
+        # read blocks of lines to avoid the per-line loop body and bytes check
+        while lines := f.readlines(READ_BLOCK_SIZE):
+            line_count += len(lines)
+            if isinstance(lines[0], bytes):
+                lines = [line.decode("utf-8") for line in lines]
 
-            smiles = extract_fn(line)
+            # extract the canonical smiles column and only keep reasonably sized molecules
+            sized_smiles = [smiles for smiles in map(extract_fn, lines) if 5 <= len(smiles) <= 200]
 
-            # only keep reasonably sized molecules
-            if 5 <= len(smiles) <= 200:
-                smiles = split_charged_mol(smiles)
-
-                if smiles_char_dict.allowed(smiles):
-                    # check whether the molecular graph consists of
-                    # multiple connected components (eg. in salts)
-                    # if so, just keep the largest one
-
-                    data.append(smiles)
+            # check whether the molecular graph consists of
+            # multiple connected components (eg. in salts)
+            # if so, just keep the largest one
+            data.extend(filter(allowed, map(split_charged_mol, sized_smiles)))
 
         print(f"Processed {len(data)} molecules from {line_count} lines in the input file.")
 
     return data
 
 
-def write_smiles(dataset: Iterable[str], filename: str) -> None:
+def write_smiles(dataset: Sequence[str], filename: str) -> None:
     """
     Dumps a list of SMILES into a file, one per line
     """
-    n_lines = 0
-    with open(filename, "w") as out:
-        for smiles_str in dataset:
-            out.write("%s\n" % smiles_str)
-            n_lines += 1
-    print(f"{filename} contains {n_lines} molecules")
+    with open(filename, "wb") as out:
+        # write blocks of lines at once instead of formatting and writing every line separately
+        for i in range(0, len(dataset), WRITE_CHUNK_SIZE):
+            chunk = dataset[i : i + WRITE_CHUNK_SIZE]
+            out.write(("\n".join(chunk) + "\n").encode("utf-8"))
+    print(f"{filename} contains {len(dataset)} molecules")
 
 
 def compare_hash(output_file: str, correct_hash: str) -> bool:
@@ -198,7 +212,15 @@ def compare_hash(output_file: str, correct_hash: str) -> bool:
     Computes the md5 hash of a SMILES file and check it against a given one
     Returns false if hashes are different
     """
-    output_hash = hashlib.md5(open(output_file, "rb").read()).hexdigest()  # noqa: S324, SIM115
+    md5 = hashlib.md5()  # noqa: S324
+    # hash in chunks to avoid loading the whole file into memory,
+    # reusing a single buffer instead of allocating a new bytes object per chunk
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(output_file, "rb") as f:
+        while size := f.readinto(buffer):
+            md5.update(view[:size])
+    output_hash = md5.hexdigest()
     if output_hash != correct_hash:
         logger.error(
             f"{output_file} file has different hash, {output_hash}, than expected, {correct_hash}!",
@@ -237,8 +259,8 @@ def main() -> None:
     data = raw_data.decode("utf-8").splitlines()
 
     holdout_mols = [i.split(" ")[0] for i in data]
-    holdout_set = list(set(canonicalize_list(holdout_mols, False)))
-    holdout_fps = get_fingerprints_from_smileslist(holdout_set)
+    holdout_set = set(canonicalize_list(holdout_mols, False, n_jobs=args.n_jobs))
+    holdout_fps = get_fingerprints_from_smileslist(list(holdout_set))
 
     # Download Chembl24 if needed.
     download_if_not_present(chembl_file, uri=CHEMBL_URL)
@@ -249,6 +271,11 @@ def main() -> None:
         extract_fn=extract_chembl,
     )
 
+    # Identical SMILES give identical results, only process each of them once
+    n_raw_smiles = len(raw_smiles)
+    raw_smiles = remove_duplicates(raw_smiles)
+    print(f"Removed {n_raw_smiles - len(raw_smiles)} duplicate SMILES.")
+
     file_prefix = "chembl24_canon"
 
     print(
@@ -259,23 +286,24 @@ def main() -> None:
     # Process all the SMILES in parallel
     runner = Parallel(n_jobs=args.n_jobs, verbose=2)
 
+    # Send the SMILES in chunks, so that the holdout data is not pickled for every single molecule
     joblist = (
-        delayed(filter_and_canonicalize)(
-            smiles_str,
-            holdout_set,
-            holdout_fps,
-            neutralization_rxns,
-            TANIMOTO_CUTOFF,
-            False,
+        delayed(filter_and_canonicalize_batch)(
+            raw_smiles[i : i + FILTER_CHUNK_SIZE],
+            holdout_set=holdout_set,
+            holdout_fps=holdout_fps,
+            neutralization_rxns=neutralization_rxns,
+            tanimoto_cutoff=TANIMOTO_CUTOFF,
+            include_stereocenters=False,
         )
-        for smiles_str in raw_smiles
+        for i in range(0, len(raw_smiles), FILTER_CHUNK_SIZE)
     )
 
-    output = runner(joblist)
+    output = list(chain.from_iterable(runner(joblist)))
 
     # Put all nonzero molecules in a list, remove duplicates, sort and shuffle
 
-    all_good_mols = sorted({item[0] for item in output if item})
+    all_good_mols = sorted(set(chain.from_iterable(output)))
     np.random.shuffle(all_good_mols)
     print(f"Ended up with {len(all_good_mols)} molecules. Preparing splits...")
 
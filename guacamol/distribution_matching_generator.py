@@ -6,6 +6,8 @@ class DistributionMatchingGenerator(metaclass=ABCMeta):
     Interface for molecule generators.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def generate(self, number_samples: int) -> list[str]:
         """
@@ -14,6 +14,8 @@ class GoalDirectedGenerator(metaclass=ABCMeta):
     Interface for goal-directed molecule generators.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def generate_optimized_molecules(
         self,
@@ -26,6 +26,9 @@ RDLogger.logger().setLevel(RDLogger.CRITICAL)
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# We only accept molecules consisting of H, B, C, N, O, F, Si, P, S, Cl, aliphatic Se, Br, I.
+METAL_SMARTS = Chem.MolFromSmarts("[!#1!#5!#6!#7!#8!#9!#14!#15!#16!#17!#34!#35!#53]")
+
 
 def is_valid(smiles: str) -> bool:
     """
@@ -64,13 +67,18 @@ def canonicalize(smiles: str, include_stereocenters: bool = True) -> str | None:
     return None
 
 
-def canonicalize_list(smiles_list: Iterable[str], include_stereocenters: bool = True) -> list[str]:
+def canonicalize_list(
+    smiles_list: Iterable[str],
+    include_stereocenters: bool = True,
+    n_jobs: int = 8,
+) -> list[str]:
     """
     Canonicalize a list of smiles. Filters out repetitions and removes corrupted molecules.
 
     Args:
         smiles_list: molecules as SMILES strings
         include_stereocenters: whether to keep the stereochemical information in the canonical SMILES strings
+        n_jobs: number of processes to use
 
     Returns:
         The canonicalized and filtered input smiles.
@@ -78,6 +86,7 @@ def canonicalize_list(smiles_list: Iterable[str], include_stereocenters: bool =
     canonicalized_smiles = parallelize(
         canonicalize,
         [(smiles, include_stereocenters) for smiles in smiles_list],
+        n_jobs=n_jobs,
         desc="Canonicalizing",
         verbose=1,
     )
@@ -170,7 +179,7 @@ def neutralise_charges(
 
 def filter_and_canonicalize(
     smiles: str,
-    holdout_set: Sequence[str],
+    holdout_set: Collection[str],
     holdout_fps: Sequence[ExplicitBitVect],
     neutralization_rxns: Sequence[tuple[Chem.Mol, Chem.Mol]],
     tanimoto_cutoff: float = 0.5,
@@ -179,7 +188,7 @@ def filter_and_canonicalize(
     """
     Args:
         smiles: the molecule to process
-        holdout_set: smiles of the holdout set
+        holdout_set: smiles of the holdout set, preferably as a set for fast lookups
         holdout_fps: ECFP4 fingerprints of the holdout set
         neutralization_rxns: neutralization rdkit reactions
         tanimoto_cutoff: Remove molecules with a higher ECFP4 tanimoto similarity than this cutoff from the set
@@ -198,10 +207,7 @@ def filter_and_canonicalize(
             return []
         mol = Chem.RemoveHs(mol)
 
-        # We only accept molecules consisting of H, B, C, N, O, F, Si, P, S, Cl, aliphatic Se, Br, I.
-        metal_smarts = Chem.MolFromSmarts("[!#1!#5!#6!#7!#8!#9!#14!#15!#16!#17!#34!#35!#53]")
-
-        has_metal = mol.HasSubstructMatch(metal_smarts)
+        has_metal = mol.HasSubstructMatch(METAL_SMARTS)
 
         # Exclude molecules containing the forbidden elements.
         if has_metal:
@@ -230,6 +236,37 @@ def filter_and_canonicalize(
     return []
 
 
+def filter_and_canonicalize_batch(
+    smiles_list: Iterable[str],
+    *,
+    holdout_set: Collection[str],
+    holdout_fps: Sequence[ExplicitBitVect],
+    neutralization_rxns: Sequence[tuple[Chem.Mol, Chem.Mol]],
+    tanimoto_cutoff: float = 0.5,
+    include_stereocenters: bool = False,
+) -> list[list[str]]:
+    """
+    Applies filter_and_canonicalize to several molecules in one call.
+
+    Useful to send a whole chunk of molecules to a worker process at once, so that the
+    holdout set and its fingerprints are serialized once per chunk instead of once per molecule.
+
+    Returns:
+        list with the output of filter_and_canonicalize for each input molecule
+    """
+    return [
+        filter_and_canonicalize(
+            smiles,
+            holdout_set,
+            holdout_fps,
+            neutralization_rxns,
+            tanimoto_cutoff,
+            include_stereocenters,
+        )
+        for smiles in smiles_list
+    ]
+
+
 def calculate_internal_pairwise_similarities(
     smiles_list: Collection[str],
 ) -> NDArray[np.float64]:
@@ -346,9 +383,8 @@ def highest_tanimoto_precalc_fps(mol: Chem.Mol, fps: Sequence[ExplicitBitVect])
         return 0
 
     fp1 = AllChem.GetMorganFingerprintAsBitVect(mol, 2, 4096)
-    sims = np.array(DataStructs.BulkTanimotoSimilarity(fp1, fps))
 
-    return sims.max()
+    return max(DataStructs.BulkTanimotoSimilarity(fp1, fps))
 
 
 def continuous_kldiv(X_baseline: NDArray[np.float64], X_sampled: NDArray[np.float64]) -> float:
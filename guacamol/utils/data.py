@@ -25,14 +25,8 @@ def remove_duplicates(list_with_duplicates: Sequence[str]) -> list[str]:
         A list with no duplicates.
     """
 
-    unique_set: set[str] = set()
-    unique_list = []
-    for element in list_with_duplicates:
-        if element not in unique_set:
-            unique_set.add(element)
-            unique_list.append(element)
-
-    return unique_list
+    # dicts keep the insertion order, and only the first insertion of a key counts
+    return list(dict.fromkeys(list_with_duplicates))
 
 
 def get_random_subset(
@@ -44,7 +38,7 @@ def get_random_subset(
     Get a random subset of some dataset.
 
     For reproducibility, the random number generator seed can be specified.
-    Nevertheless, the state of the random number generator is restored to avoid side effects.
+    In that case, a separate generator is used so that the global numpy random state is not affected.
 
     Args:
         dataset: full set to select a subset from
@@ -59,20 +53,17 @@ def get_random_subset(
             f"The dataset to extract a subset from is too small: {len(dataset)} < {subset_size}",
         )
 
-    # save random number generator state
-    rng_state = np.random.get_state()
-
+    # Draw indices rather than passing the dataset itself, to avoid converting it to a NumPy array.
+    # For a given seed, the selected elements are the same as with np.random.choice(dataset, ...).
     if seed is not None:
         # extract a subset (for a given training set, the subset will always be identical).
-        np.random.seed(seed)
-
-    subset = np.random.choice(dataset, subset_size, replace=False)
-
-    if seed is not None:
-        # reset random number generator state, only if needed
-        np.random.set_state(rng_state)
+        # A local generator yields the same numbers as seeding the global one, without side effects.
+        indices = np.random.RandomState(seed).choice(len(dataset), subset_size, replace=False)
+    else:
+        indices = np.random.choice(len(dataset), subset_size, replace=False)
 
-    return list(subset)
+    # indexing with Python ints is cheaper than with NumPy integer scalars
+    return [dataset[i] for i in indices.tolist()]
 
 
 def download_if_not_present(filename: str, uri: str) -> None:
@@ -1,21 +1,56 @@
-from typing import Literal
+from __future__ import annotations
 
-from rdkit.Chem import AllChem, Mol
+from typing import TYPE_CHECKING, Literal
+
+from rdkit.Chem import AllChem, Mol, rdFingerprintGenerator
 from rdkit.Chem.AtomPairs.Sheridan import GetBPFingerprint, GetBTFingerprint
 from rdkit.Chem.Pharm2D import Generate, Gobbi_Pharm2D
-from rdkit.DataStructs import (
-    ExplicitBitVect,
-    IntSparseIntVect,
-    LongSparseIntVect,
-    SparseBitVect,
-    UIntSparseIntVect,
-)
 from typing_extensions import TypeAlias
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from rdkit.DataStructs import (
+        ExplicitBitVect,
+        IntSparseIntVect,
+        LongSparseIntVect,
+        SparseBitVect,
+        UIntSparseIntVect,
+    )
+
 FpT: TypeAlias = (
     "IntSparseIntVect | SparseBitVect | LongSparseIntVect | ExplicitBitVect | UIntSparseIntVect"
 )
-FpNameT = Literal["AP", "PHCO", "BPF", "BTF", "PATH", "ECFP4", "ECFP6", "FCFP4", "FCFP6"]
+FpNameT = Literal[
+    "AP",
+    "PHCO",
+    "BPF",
+    "BTF",
+    "PATH",
+    "ECFP4",
+    "ECFP6",
+    "FCFP4",
+    "FCFP6",
+    "ECFP4_BV",
+    "ECFP6_BV",
+    "FCFP4_BV",
+    "FCFP6_BV",
+]
+
+# Morgan fingerprint generators for the folded bitvector variants, created once and reused
+_MORGAN_BV_SIZE = 2048
+_ECFP4_BV_GENERATOR = rdFingerprintGenerator.GetMorganGenerator(radius=2, fpSize=_MORGAN_BV_SIZE)
+_ECFP6_BV_GENERATOR = rdFingerprintGenerator.GetMorganGenerator(radius=3, fpSize=_MORGAN_BV_SIZE)
+_FCFP4_BV_GENERATOR = rdFingerprintGenerator.GetMorganGenerator(
+    radius=2,
+    fpSize=_MORGAN_BV_SIZE,
+    atomInvariantsGenerator=rdFingerprintGenerator.GetMorganFeatureAtomInvGen(),
+)
+_FCFP6_BV_GENERATOR = rdFingerprintGenerator.GetMorganGenerator(
+    radius=3,
+    fpSize=_MORGAN_BV_SIZE,
+    atomInvariantsGenerator=rdFingerprintGenerator.GetMorganFeatureAtomInvGen(),
+)
 
 
 class _FingerprintCalculator:
@@ -28,7 +63,7 @@ class _FingerprintCalculator:
 
     def get_fingerprint(self, mol: Mol, fp_type: FpNameT) -> FpT:
         method_name = "get_" + fp_type
-        method = getattr(self, method_name)
+        method = getattr(self, method_name, None)
         if method is None:
             raise Exception(f"{fp_type} is not a supported fingerprint type.")
         return method(mol)
@@ -60,6 +95,35 @@ class _FingerprintCalculator:
     def get_FCFP6(self, mol: Mol) -> UIntSparseIntVect:
         return AllChem.GetMorganFingerprint(mol, 3, useFeatures=True)
 
+    # The *_BV variants are 2048-bit bitvectors: Tanimoto similarities are faster to compute
+    # than for the count-based ECFP/FCFP above, but differ from them because of bit collisions.
+
+    def get_ECFP4_BV(self, mol: Mol) -> ExplicitBitVect:
+        return _ECFP4_BV_GENERATOR.GetFingerprint(mol)
+
+    def get_ECFP6_BV(self, mol: Mol) -> ExplicitBitVect:
+        return _ECFP6_BV_GENERATOR.GetFingerprint(mol)
+
+    def get_FCFP4_BV(self, mol: Mol) -> ExplicitBitVect:
+        return _FCFP4_BV_GENERATOR.GetFingerprint(mol)
+
+    def get_FCFP6_BV(self, mol: Mol) -> ExplicitBitVect:
+        return _FCFP6_BV_GENERATOR.GetFingerprint(mol)
+
+
+_FP_CALCULATOR = _FingerprintCalculator()
+
+# Resolve the fingerprint functions once instead of on every call to get_fingerprint
+_FP_FUNCTIONS: dict[str, Callable[[Mol], FpT]] = {
+    name[len("get_") :]: getattr(_FP_CALCULATOR, name)
+    for name in dir(_FingerprintCalculator)
+    if name.startswith("get_") and name != "get_fingerprint"
+}
+
 
 def get_fingerprint(mol: Mol, fp_type: FpNameT) -> FpT:
-    return _FingerprintCalculator().get_fingerprint(mol=mol, fp_type=fp_type)
+    try:
+        fp_function = _FP_FUNCTIONS[fp_type]
+    except KeyError:
+        raise Exception(f"{fp_type} is not a supported fingerprint type.") from None
+    return fp_function(mol)
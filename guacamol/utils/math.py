@@ -14,5 +14,12 @@ def geometric_mean(values: Sequence[float]) -> float:
     """
     Computes the geometric mean of a list of values.
     """
-    a = np.array(values)
-    return a.prod() ** (1.0 / len(a))
+    a = np.asarray(values, dtype=np.float64)
+    prod = a.prod()
+
+    # For many small values, the product underflows: average the logarithms instead.
+    # This is only done when needed, since the product is exact for the usual few values.
+    if prod < np.finfo(np.float64).tiny and a.all():
+        return float(np.exp(np.log(a).mean()))
+
+    return float(prod ** (1.0 / len(a)))
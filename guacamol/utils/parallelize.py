@@ -44,5 +44,9 @@ def parallelize(
     n_jobs = int(env_jobs) if env_jobs else n_jobs
     jobs = [joblib.delayed(func)(*args) for args in jobs_args]
 
-    with joblib.Parallel(n_jobs=n_jobs, return_as="generator") as p:
+    # Send the jobs in batches (about 8 per worker) to amortize the dispatch overhead
+    # for many small jobs, instead of letting joblib ramp up from single-job batches.
+    batch_size = max(1, len(jobs) // (joblib.effective_n_jobs(n_jobs) * 8))
+
+    with joblib.Parallel(n_jobs=n_jobs, batch_size=batch_size, return_as="generator") as p:
         return list(tqdm(p(jobs), desc=desc, total=len(jobs), leave=leave, disable=verbose == 0))
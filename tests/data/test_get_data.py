@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from guacamol.data import get_data
+from guacamol.data.get_data import AllowedSmilesCharDictionary, extract_chembl, get_raw_smiles
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+CHEMBL_LINES = [
+    "chembl_id\tcanonical_smiles\tstandard_inchi\n",
+    "CHEMBL1\tCCO\tInChI=1S\n",
+    "CHEMBL2\tCCCCO\tInChI=1S\n",
+    "CHEMBL3\t" + "C" * 201 + "\tInChI=1S\n",
+    "CHEMBL4\tCC(=O)Oc1ccccc1C(=O)O\tInChI=1S\n",
+    "CHEMBL5\tCCCCCC.[Na+]\tInChI=1S\n",
+    "CHEMBL6\tCC[Fe]CC\tInChI=1S\n",
+    "CHEMBL7\t" + "C" * 200 + "\tInChI=1S\n",
+] * 3
+
+# header, too short, too long and forbidden symbols are dropped, salts are split
+EXPECTED_SMILES = [
+    "CCCCO",
+    "CC(=O)Oc1ccccc1C(=O)O",
+    "CCCCCC",
+    "C" * 200,
+] * 3
+
+
+def _open_binary(file_name: str, _mode: str) -> Any:
+    return open(file_name, "rb")
+
+
+@pytest.mark.parametrize("open_fn", [open, gzip.open, _open_binary])
+def test_get_raw_smiles(
+    open_fn: Callable[..., Any],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    file_name = str(tmp_path / "chembl.txt")
+    writer = gzip.open if open_fn is gzip.open else open
+    with writer(file_name, "wt") as f:
+        f.writelines(CHEMBL_LINES)
+
+    # make the input span many blocks of lines
+    monkeypatch.setattr(get_data, "READ_BLOCK_SIZE", 64)
+
+    smiles = get_raw_smiles(
+        file_name,
+        smiles_char_dict=AllowedSmilesCharDictionary(),
+        open_fn=open_fn,
+        extract_fn=extract_chembl,
+    )
+
+    assert smiles == EXPECTED_SMILES
@@ -9,6 +9,8 @@ class MockGenerator(DistributionMatchingGenerator):
     possibly split in several calls
     """
 
+    __slots__ = ("cursor", "molecules")
+
     def __init__(self, molecules: Sequence[str]) -> None:
         self.molecules = molecules
         self.cursor = 0
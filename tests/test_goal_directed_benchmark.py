@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from guacamol.benchmark_suites import goal_directed_benchmark_suite
 from guacamol.goal_directed_benchmark import GoalDirectedBenchmark
 from guacamol.goal_directed_generator import GoalDirectedGenerator
 from guacamol.goal_directed_score_contributions import uniform_specification
@@ -42,6 +43,21 @@ class MockGenerator(GoalDirectedGenerator):
         return list(self.molecules)
 
 
+class MockScoringGenerator(MockGenerator):
+    """
+    Mock generator that scores its pre-defined molecules before returning them
+    """
+
+    def generate_optimized_molecules(
+        self,
+        scoring_function: ScoringFunction,
+        number_molecules: int,
+        starting_population: Sequence[str] | None = None,
+    ) -> list[str]:
+        scoring_function.score_list(self.molecules)
+        return super().generate_optimized_molecules(scoring_function, number_molecules)
+
+
 def test_removes_duplicates() -> None:
     """
     Assert that duplicated molecules (even with different SMILES strings) are considered only once.
@@ -88,3 +104,21 @@ def test_correct_score_with_multiple_contributions() -> None:
     expected_score = (top1 + top3) / 2
 
     assert benchmark.assess_model(generator).score == pytest.approx(expected_score)
+
+
+def test_scoring_function_calls_counted_per_assessment() -> None:
+    top3 = uniform_specification(3)
+    benchmark = GoalDirectedBenchmark("benchmark", MockScoringFunction(), top3)
+    generator = MockScoringGenerator(["OCC", "CCCCOCCCC", "C"])
+
+    assert benchmark.assess_model(generator).number_scoring_function_calls == 3
+    assert benchmark.assess_model(generator).number_scoring_function_calls == 3
+
+
+def test_goal_directed_benchmark_suite_is_cached() -> None:
+    suite1 = goal_directed_benchmark_suite("trivial")
+    suite2 = goal_directed_benchmark_suite("trivial")
+
+    assert suite1 is not suite2
+    assert len(suite1) == len(suite2)
+    assert all(b1 is b2 for b1, b2 in zip(suite1, suite2))
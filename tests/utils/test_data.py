@@ -38,3 +38,27 @@ def test_subset_with_random_seed() -> None:
 
     assert subset1 == subset2
     assert subset1 != subset3
+
+
+def test_subset_with_random_seed_matches_legacy_sampling() -> None:
+    # the reference subsets of the benchmarks must stay identical to
+    # the ones obtained with np.random.seed + np.random.choice on the dataset
+    dataset = ["C" * i + "O" for i in range(1, 101)]
+
+    for seed in (0, 7, 42):
+        np.random.seed(seed)
+        expected = list(np.random.choice(dataset, 10, replace=False))
+
+        assert get_random_subset(dataset, 10, seed=seed) == expected
+
+
+def test_subset_with_random_seed_keeps_global_random_state() -> None:
+    dataset = list(np.random.rand(100))
+
+    state_before = np.random.get_state()
+    get_random_subset(dataset, 10, seed=33)
+    state_after = np.random.get_state()
+
+    assert state_before[0] == state_after[0]
+    assert np.array_equal(state_before[1], state_after[1])
+    assert state_before[2:] == state_after[2:]
@@ -0,0 +1,54 @@
+import pytest
+from rdkit import Chem
+from rdkit.Chem import AllChem
+from rdkit.DataStructs import ExplicitBitVect, TanimotoSimilarity
+
+from guacamol.utils.fingerprints import FpNameT, get_fingerprint
+
+CELECOXIB = "CC1=CC=C(C=C1)C1=CC(=NN1C1=CC=C(C=C1)S(N)(=O)=O)C(F)(F)F"
+
+
+@pytest.mark.parametrize("fp_type", ["ECFP4_BV", "ECFP6_BV", "FCFP4_BV", "FCFP6_BV"])
+def test_morgan_bitvector_fingerprints(fp_type: FpNameT) -> None:
+    mol = Chem.MolFromSmiles(CELECOXIB)
+    other = Chem.MolFromSmiles("CCOCC")
+
+    fp = get_fingerprint(mol, fp_type)
+
+    assert isinstance(fp, ExplicitBitVect)
+    assert fp.GetNumBits() == 2048
+    assert TanimotoSimilarity(fp, get_fingerprint(mol, fp_type)) == 1.0
+    assert TanimotoSimilarity(fp, get_fingerprint(other, fp_type)) < 1.0
+
+
+@pytest.mark.parametrize(("fp_type", "radius"), [("ECFP4_BV", 2), ("ECFP6_BV", 3)])
+def test_morgan_bitvector_fingerprints_match_reference(fp_type: FpNameT, radius: int) -> None:
+    mol = Chem.MolFromSmiles(CELECOXIB)
+
+    fp = get_fingerprint(mol, fp_type)
+    reference = AllChem.GetMorganFingerprintAsBitVect(mol, radius, 2048)
+
+    assert list(fp.GetOnBits()) == list(reference.GetOnBits())
+
+
+@pytest.mark.parametrize(
+    ("ecfp_type", "fcfp_type"),
+    [("ECFP4_BV", "FCFP4_BV"), ("ECFP6_BV", "FCFP6_BV")],
+)
+def test_feature_morgan_bitvector_fingerprints_differ(
+    ecfp_type: FpNameT,
+    fcfp_type: FpNameT,
+) -> None:
+    mol = Chem.MolFromSmiles(CELECOXIB)
+
+    ecfp = get_fingerprint(mol, ecfp_type)
+    fcfp = get_fingerprint(mol, fcfp_type)
+
+    assert list(ecfp.GetOnBits()) != list(fcfp.GetOnBits())
+
+
+def test_unknown_fingerprint_type() -> None:
+    mol = Chem.MolFromSmiles("CCOCC")
+
+    with pytest.raises(Exception, match="not a supported fingerprint type"):
+        get_fingerprint(mol, "XYZ")  # type: ignore[arg-type]
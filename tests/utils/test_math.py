@@ -0,0 +1,20 @@
+from math import sqrt
+
+import pytest
+
+from guacamol.utils.math import arithmetic_mean, geometric_mean
+
+
+def test_arithmetic_mean() -> None:
+    assert arithmetic_mean([0.2, 0.4, 0.9]) == pytest.approx(0.5)
+
+
+def test_geometric_mean() -> None:
+    assert geometric_mean([0.232, 0.010]) == sqrt(0.232 * 0.010)
+    assert geometric_mean([0.5, 0.0, 0.8]) == 0.0
+
+
+def test_geometric_mean_does_not_underflow() -> None:
+    values = [1e-5] * 100
+
+    assert geometric_mean(values) == pytest.approx(1e-5)